@@ -1,19 +1,438 @@
 """Main module for DuckDB FastAPI application."""
 
+import importlib.util
+import io
+import os
+import queue
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import List, Optional
+from stat import S_ISDIR, S_ISREG
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    TypedDict,
+)
 
+import anyio.to_thread
 import duckdb
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-import uvicorn
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+import orjson
+from starlette.concurrency import run_in_threadpool
 
+if TYPE_CHECKING:
+    import pyarrow as pa
 
-class DataResponse(BaseModel):
-    """Response model for data queries."""
+# pyarrow is optional and only needed for Arrow endpoints, so it is looked up
+# here but imported on first use
+_ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
-    data: dict
-    message: str
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Media types of supported files when served as-is
+_RAW_MEDIA_TYPES = {
+    ".json": "application/json",
+    ".csv": "text/csv",
+    ".parquet": "application/vnd.apache.parquet",
+}
+
+# Worker threads available for blocking DuckDB calls
+_THREAD_POOL_SIZE = 64
+
+# Cursors kept per app for short queries; requests beyond this wait for one
+_CURSOR_POOL_SIZE = os.cpu_count() or 4
+
+# Responses smaller than this many bytes are sent uncompressed
+_GZIP_MINIMUM_SIZE = 1024
+
+# Moderate gzip level: most of the size reduction for a fraction of the CPU
+_GZIP_COMPRESS_LEVEL = 5
+
+# Rows per Arrow record batch when streaming query results
+_ARROW_BATCH_SIZE = 65536
+
+# Rows fetched and encoded at a time when streaming JSON results
+_JSON_BATCH_SIZE = 10000
+
+# Sources at least this large (in bytes) have their JSON results streamed
+# instead of built in memory and cached
+_STREAM_MIN_SIZE = 16 * 1024 * 1024
+
+# Clients may keep data responses but must revalidate them with the ETag,
+# which costs the server one stat call and no query
+_CACHE_CONTROL = "no-cache"
+
+# Parsed column/limit variants kept per data endpoint; others are parsed
+# on every request
+_PREPARED_PER_ENDPOINT = 32
+
+# Range of integers orjson can encode; wider decimals are sent as strings
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+# Characters replaced by underscores in endpoint names
+_NAME_TRANSLATION = str.maketrans({" ": "_", "-": "_"})
+
+# Queries used to read each supported file type, bound to the file path
+_READ_QUERIES = {
+    ".json": "SELECT * FROM read_json_auto(?)",
+    ".csv": "SELECT * FROM read_csv_auto(?)",
+    ".parquet": "SELECT * FROM read_parquet(?)",
+}
+
+# Queries used to read a directory of same-format files, bound to a glob.
+# DuckDB scans the matched files in parallel.
+_DATASET_QUERIES = {
+    ".csv": "SELECT * FROM read_csv_auto(?, union_by_name = true)",
+    ".parquet": "SELECT * FROM read_parquet(?)",
+}
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert values orjson cannot serialize natively.
+
+    Mirrors FastAPI's ``jsonable_encoder`` for the extra types DuckDB returns.
+
+    Args:
+        value: Value found while serializing
+
+    Returns:
+        Any: JSON-compatible replacement
+
+    Raises:
+        TypeError: If the value type is not supported
+    """
+    if isinstance(value, Decimal):
+        # Non-finite values have a letter exponent ('n', 'N' or 'F')
+        if value.is_finite() and int(value.as_tuple().exponent) >= 0:
+            integer = int(value)
+            # orjson only encodes 64-bit integers; keep wider values exact
+            if _INT64_MIN <= integer <= _INT64_MAX:
+                return integer
+            return str(value)
+        return float(value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _encode_json(content: Any) -> bytes:
+    """
+    Serialize a response body with orjson.
+
+    Args:
+        content: JSON-compatible value, possibly holding DuckDB result types
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    return orjson.dumps(content, default=_json_default, option=_ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return _encode_json(content)
+
+
+# Encoded query results for data files, keyed by
+# (path, size, mtime_ns, columns, limit) so that any change to a file
+# invalidates its entries. Oldest entries are evicted first.
+_RESULT_CACHE_MAXSIZE = 64
+_RESULT_CACHE: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+
+
+# Encoded directory listing responses keyed by directory path, stored with the
+# directory's mtime_ns; adding, removing or renaming an entry updates the mtime.
+_DIR_CACHE: Dict[str, Tuple[int, bytes]] = {}
+
+
+class _CursorPool:
+    """Bounded pool of reusable cursors on one DuckDB database."""
+
+    def __init__(self, db: duckdb.DuckDBPyConnection, size: int) -> None:
+        self._db = db
+        self._idle: "queue.LifoQueue[duckdb.DuckDBPyConnection]" = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(db.cursor())
+
+    @contextmanager
+    def cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Borrow a cursor, blocking until one is free."""
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def prepare(self, sql: str) -> Any:
+        """Parse a query on the pooled database; see ``_prepare_query``."""
+        return _prepare_query(self._db, sql)
+
+    def new_cursor(self) -> duckdb.DuckDBPyConnection:
+        """Open a cursor outside the pool, for long-lived results."""
+        return self._db.cursor()
+
+    def close(self) -> None:
+        """Close the idle cursors."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _cache_get(key: Tuple[Any, ...]) -> Optional[bytes]:
+    """
+    Look up a cached query result and mark it as recently used.
+
+    Args:
+        key: Cache key as (path, size, mtime_ns, columns, limit)
+
+    Returns:
+        Optional[bytes]: The encoded response body, if any
+    """
+    body = _RESULT_CACHE.get(key)
+    if body is not None:
+        _RESULT_CACHE.move_to_end(key)
+    return body
+
+
+def _cache_put(key: Tuple[Any, ...], body: bytes) -> None:
+    """
+    Store a query result, evicting the least recently used entry when full.
+
+    Args:
+        key: Cache key as (path, size, mtime_ns, columns, limit)
+        body: Encoded response body to cache
+    """
+    _RESULT_CACHE[key] = body
+    _RESULT_CACHE.move_to_end(key)
+    if len(_RESULT_CACHE) > _RESULT_CACHE_MAXSIZE:
+        _RESULT_CACHE.popitem(last=False)
+
+
+def _source_stat(item_path: Path) -> Tuple[int, int]:
+    """
+    Get the size and modification time of a data source.
+
+    For a dataset directory these are the total size and the latest
+    modification time over the directory and the files in it.
+
+    Args:
+        item_path: File or dataset directory
+
+    Returns:
+        Tuple[int, int]: Size in bytes and mtime in nanoseconds
+    """
+    stat = os.stat(item_path)
+    if not S_ISDIR(stat.st_mode):
+        return stat.st_size, stat.st_mtime_ns
+
+    size, mtime_ns = 0, stat.st_mtime_ns
+    with os.scandir(item_path) as entries:
+        for entry in entries:
+            entry_stat = entry.stat()
+            size += entry_stat.st_size
+            mtime_ns = max(mtime_ns, entry_stat.st_mtime_ns)
+    return size, mtime_ns
+
+
+def _file_etag(size: int, mtime_ns: int, variant: str = "") -> str:
+    """
+    Build an ETag for a data source from its size and modification time.
+
+    Args:
+        size: Size in bytes
+        mtime_ns: Modification time in nanoseconds
+        variant: Suffix distinguishing other representations of the same data
+
+    Returns:
+        str: Quoted ETag value
+    """
+    return f'"{size:x}-{mtime_ns:x}{variant}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag.
+
+    The header may list several entity tags or be ``*``; tags are compared
+    weakly, ignoring any ``W/`` prefix, as RFC 9110 requires for this header.
+
+    Args:
+        if_none_match: Header value
+        etag: Quoted ETag of the current representation
+
+    Returns:
+        bool: Whether any listed tag matches
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == opaque:
+            return True
+    return False
+
+
+def _not_modified_since(if_modified_since: Optional[str], mtime_ns: int) -> bool:
+    """
+    Check an If-Modified-Since header against a modification time.
+
+    HTTP dates have one-second resolution, so the mtime is truncated before
+    comparing. Unparseable dates never match.
+
+    Args:
+        if_modified_since: Header value, if the request sent one
+        mtime_ns: Modification time in nanoseconds
+
+    Returns:
+        bool: Whether the data is unchanged since the given date
+    """
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return mtime_ns // 1_000_000_000 <= int(since.timestamp())
+
+
+def _prefers_arrow(accept: str) -> bool:
+    """
+    Decide from an Accept header whether to answer with an Arrow stream.
+
+    Arrow is chosen when its media type is listed with a non-zero quality
+    that is not lower than the quality given to ``application/json``.
+
+    Args:
+        accept: Accept header value
+
+    Returns:
+        bool: Whether the Arrow stream is preferred over JSON
+    """
+    qualities: Dict[str, float] = {}
+    for media_range in accept.split(","):
+        media_type, *params = media_range.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[media_type.strip().lower()] = quality
+    arrow = qualities.get(ARROW_STREAM_MEDIA_TYPE, 0.0)
+    return arrow > 0 and arrow >= qualities.get("application/json", 0.0)
+
+
+def _arrow_reader(conn: duckdb.DuckDBPyConnection) -> "pa.RecordBatchReader":
+    """
+    Fetch the pending result of a cursor as an Arrow record batch reader.
+
+    Args:
+        conn: Cursor on which a query has been executed
+
+    Returns:
+        pa.RecordBatchReader: Reader yielding batches of ``_ARROW_BATCH_SIZE`` rows
+    """
+    # fetch_record_batch was renamed to_arrow_reader in newer DuckDB releases
+    fetch = getattr(conn, "to_arrow_reader", None) or conn.fetch_record_batch
+    return fetch(_ARROW_BATCH_SIZE)
+
+
+def _iter_arrow_stream(
+    conn: duckdb.DuckDBPyConnection, reader: "pa.RecordBatchReader"
+) -> Iterator[bytes]:
+    """
+    Encode record batches as an Arrow IPC stream, one chunk per batch.
+
+    Args:
+        conn: Cursor the reader fetches from; closed once the stream ends
+        reader: Source of record batches
+
+    Yields:
+        bytes: Consecutive pieces of the IPC stream
+    """
+    import pyarrow.ipc
+
+    sink = io.BytesIO()
+
+    def drain() -> bytes:
+        chunk = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return chunk
+
+    try:
+        with pyarrow.ipc.new_stream(sink, reader.schema) as writer:
+            yield drain()
+            for batch in reader:
+                writer.write_batch(batch)
+                yield drain()
+        yield drain()
+    finally:
+        conn.close()
+
+
+def _iter_json_result(conn: duckdb.DuckDBPyConnection) -> Iterator[bytes]:
+    """
+    Encode an executed query as the data endpoint's JSON body, batch by batch.
+
+    Produces the same document as ``_run_and_pack``; the row count is only
+    known at the end, so it comes last.
+
+    Args:
+        conn: Cursor holding an executed query
+
+    Yields:
+        bytes: Consecutive pieces of the JSON document
+    """
+    columns = [desc[0] for desc in conn.description] if conn.description else []
+    count = 0
+    try:
+        yield b'{"data":['
+        while True:
+            rows = conn.fetchmany(_JSON_BATCH_SIZE)
+            if not rows:
+                break
+            if count:
+                yield b","
+            # Encode the batch as one array and drop its brackets
+            encoded = orjson.dumps(rows, default=_json_default, option=_ORJSON_OPTIONS)
+            yield encoded[1:-1]
+            count += len(rows)
+        yield b'],"columns":' + orjson.dumps(columns) + b',"count":%d}' % count
+    finally:
+        conn.close()
 
 
 def _get_data_path(path_data: str) -> Path:
@@ -66,15 +485,470 @@ def _get_items_to_process(
             if item_path.exists():
                 items.append(item_path)
     else:
-        # Get all items in the directory
-        for item in sorted(data_path.iterdir()):
-            if item.is_file() or item.is_dir():
-                items.append(item)
+        # Get all items in the directory; scandir entries already know their
+        # type, so this needs no stat call per entry
+        with os.scandir(data_path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_file() or entry.is_dir():
+                    items.append(data_path / entry.name)
 
     return items
 
 
-def _create_endpoints(app: FastAPI, data_path: Path, items: List[Path]) -> None:
+def _prepare_query(db: duckdb.DuckDBPyConnection, sql: str) -> Any:
+    """
+    Parse a query once so that requests only bind and execute it.
+
+    DuckDB's Python API has no prepared statement handle; the parsed statement
+    returned by ``extract_statements`` is the closest equivalent and can be
+    passed to ``execute`` from any cursor. Older DuckDB releases without
+    ``extract_statements`` get the SQL text back unchanged.
+
+    Args:
+        db: DuckDB connection used to parse the query
+        sql: Single SQL statement
+
+    Returns:
+        Any: Parsed statement, or the SQL text when parsing is unavailable
+    """
+    extract = getattr(db, "extract_statements", None)
+    if extract is None:
+        return sql
+    (statement,) = extract(sql)
+    return statement
+
+
+def _run_and_pack(pool: _CursorPool, query: Any, params: List[Any]) -> Dict[str, Any]:
+    """
+    Execute a query on a pooled cursor and pack the rows into a response body.
+
+    Blocking; endpoints call it through the thread pool, so waiting for a free
+    cursor happens in a worker thread rather than on the event loop.
+
+    Args:
+        pool: Cursor pool of the app
+        query: SQL text or parsed statement
+        params: Query parameters
+
+    Returns:
+        Dict[str, Any]: Rows, column names and row count
+    """
+    with pool.cursor() as conn:
+        result = conn.execute(query, params).fetchall()
+        columns = [desc[0] for desc in conn.description] if conn.description else []
+    return {"data": result, "columns": columns, "count": len(result)}
+
+
+def _describe_columns(pool: _CursorPool, query: Any, params: List[Any]) -> List[str]:
+    """
+    Return the column names a query produces, without reading its rows.
+
+    Blocking; endpoints call it through the thread pool.
+
+    Args:
+        pool: Cursor pool of the app
+        query: SQL text
+        params: Query parameters
+
+    Returns:
+        List[str]: Column names in order
+    """
+    with pool.cursor() as conn:
+        return [row[0] for row in conn.execute(f"DESCRIBE {query}", params).fetchall()]
+
+
+def _projected_query(
+    sql: str, columns: Optional[Tuple[str, ...]], limited: bool
+) -> str:
+    """
+    Wrap a read query to keep only some columns and rows.
+
+    DuckDB pushes the projection and limit down into the file scan, so
+    unrequested parquet column chunks are never read.
+
+    Args:
+        sql: Query reading the data
+        columns: Validated column names to keep; all columns when None
+        limited: Whether to add a ``LIMIT ?`` placeholder after the query's
+            own parameters
+
+    Returns:
+        str: The wrapped query
+    """
+    projection = (
+        ", ".join('"' + name.replace('"', '""') + '"' for name in columns)
+        if columns
+        else "*"
+    )
+    query = f"SELECT {projection} FROM ({sql})"
+    if limited:
+        query += " LIMIT ?"
+    return query
+
+
+def _open_result(
+    pool: _CursorPool, query: Any, params: List[Any]
+) -> duckdb.DuckDBPyConnection:
+    """
+    Execute a query on a dedicated cursor, leaving the rows to be fetched.
+
+    Used for streamed responses, which hold their cursor until the client has
+    read everything. Blocking; endpoints call it through the thread pool.
+
+    Args:
+        pool: Cursor pool of the app
+        query: SQL text or parsed statement
+        params: Query parameters
+
+    Returns:
+        duckdb.DuckDBPyConnection: Cursor with the executed query
+    """
+    conn = pool.new_cursor()
+    try:
+        conn.execute(query, params)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def _open_arrow_reader(
+    pool: _CursorPool, query: Any, params: List[Any]
+) -> Tuple[duckdb.DuckDBPyConnection, "pa.RecordBatchReader"]:
+    """
+    Execute a query and return its Arrow batch reader.
+
+    The reader is consumed while the response streams, for as long as the
+    client takes, so it gets its own cursor instead of holding a pooled one.
+    Blocking; endpoints call it through the thread pool.
+
+    Args:
+        pool: Cursor pool of the app
+        query: SQL text or parsed statement
+        params: Query parameters
+
+    Returns:
+        Tuple[duckdb.DuckDBPyConnection, pa.RecordBatchReader]: The cursor,
+        which the caller must close, and the reader over its result
+    """
+    conn = _open_result(pool, query, params)
+    try:
+        return conn, _arrow_reader(conn)
+    except BaseException:
+        conn.close()
+        raise
+
+
+def _configure_thread_pool() -> None:
+    """Raise the worker thread limit so more DuckDB queries can run at once."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = _THREAD_POOL_SIZE
+
+
+def _dataset_source(item_path: Path) -> Optional[Tuple[str, str]]:
+    """
+    Detect a directory holding a single dataset split across files.
+
+    This is the layout written by Spark and similar tools, e.g. ``part-*.parquet``
+    plus a ``_SUCCESS`` marker. Entries starting with ``_`` or ``.`` are ignored;
+    every other entry must be a file with the same supported suffix.
+
+    Args:
+        item_path: Directory to inspect
+
+    Returns:
+        Optional[Tuple[str, str]]: Query and glob for the dataset, or None
+    """
+    suffixes = set()
+    with os.scandir(item_path) as entries:
+        for entry in entries:
+            if entry.name.startswith(("_", ".")):
+                continue
+            if not entry.is_file():
+                return None
+            suffixes.add(os.path.splitext(entry.name)[1])
+
+    if len(suffixes) != 1:
+        return None
+    suffix = suffixes.pop()
+    sql = _DATASET_QUERIES.get(suffix)
+    if sql is None:
+        return None
+    return sql, str(item_path / f"*{suffix}")
+
+
+def _make_file_handler(
+    item_path: Path,
+    sql: str,
+    pool: _CursorPool,
+    source: Optional[str] = None,
+) -> Callable[[Request], Awaitable[Response]]:
+    """
+    Build the JSON data endpoint for a single file or dataset directory.
+
+    Args:
+        item_path: File or dataset directory served by the endpoint
+        sql: Query reading the data, with its source as the only parameter
+        pool: Cursor pool of the app
+        source: Query parameter; defaults to ``item_path``
+
+    Returns:
+        Callable: Endpoint coroutine function
+    """
+    params = [source or str(item_path)]
+    path_str = str(item_path)
+    # Column names of the current version of the source, keyed by its stat
+    known_columns: Dict[Tuple[int, int], List[str]] = {}
+    # Parsed queries keyed by (columns, has limit); the limit itself is bound
+    prepared: Dict[Tuple[Optional[Tuple[str, ...]], bool], Any] = {
+        (None, False): pool.prepare(sql)
+    }
+
+    async def read_file(
+        request: Request,
+        columns: Optional[str] = None,
+        limit: Optional[int] = Query(None, ge=0),
+    ) -> Response:
+        """Read and return file data, optionally only some columns and rows."""
+        try:
+            # A dataset directory stats every file, so keep it off the loop
+            if source is None:
+                size, mtime_ns = _source_stat(item_path)
+            else:
+                size, mtime_ns = await run_in_threadpool(_source_stat, item_path)
+            # Clients that accept an Arrow stream get one instead of JSON
+            wants_arrow = _ARROW_AVAILABLE and _prefers_arrow(
+                request.headers.get("accept", "")
+            )
+            etag = _file_etag(size, mtime_ns, "-arrow" if wants_arrow else "")
+            headers = {
+                "ETag": etag,
+                "Cache-Control": _CACHE_CONTROL,
+                "Vary": "Accept",
+                "Last-Modified": formatdate(mtime_ns / 1e9, usegmt=True),
+            }
+            # If-Modified-Since is only consulted without If-None-Match
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match is not None:
+                not_modified = _etag_matches(if_none_match, etag)
+            else:
+                not_modified = _not_modified_since(
+                    request.headers.get("if-modified-since"), mtime_ns
+                )
+            if not_modified:
+                return Response(status_code=304, headers=headers)
+
+            selected = None
+            if columns:
+                available = known_columns.get((size, mtime_ns))
+                if available is None:
+                    available = await run_in_threadpool(
+                        _describe_columns, pool, sql, params
+                    )
+                    known_columns.clear()
+                    known_columns[(size, mtime_ns)] = available
+                selected = tuple(name.strip() for name in columns.split(","))
+                unknown = [name for name in selected if name not in available]
+                if unknown:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Unknown columns: {', '.join(unknown)}",
+                    )
+
+            variant = (selected, limit is not None)
+            run_query = prepared.get(variant)
+            if run_query is None:
+                run_query = _projected_query(sql, *variant)
+                if len(prepared) < _PREPARED_PER_ENDPOINT:
+                    run_query = prepared[variant] = pool.prepare(run_query)
+            run_params = params if limit is None else [*params, limit]
+
+            if wants_arrow:
+                conn, reader = await run_in_threadpool(
+                    _open_arrow_reader, pool, run_query, run_params
+                )
+                return StreamingResponse(
+                    _iter_arrow_stream(conn, reader),
+                    media_type=ARROW_STREAM_MEDIA_TYPE,
+                    headers=headers,
+                )
+
+            if size >= _STREAM_MIN_SIZE:
+                conn = await run_in_threadpool(
+                    _open_result, pool, run_query, run_params
+                )
+                return StreamingResponse(
+                    _iter_json_result(conn),
+                    media_type="application/json",
+                    headers=headers,
+                )
+
+            cache_key = (path_str, size, mtime_ns, selected, limit)
+            body = _cache_get(cache_key)
+            if body is None:
+                payload = await run_in_threadpool(
+                    _run_and_pack, pool, run_query, run_params
+                )
+                body = _encode_json(payload)
+                _cache_put(cache_key, body)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error reading file: {str(e)}")
+
+        return Response(body, media_type="application/json", headers=headers)
+
+    return read_file
+
+
+def _make_arrow_handler(
+    item_path: Path,
+    sql: str,
+    pool: _CursorPool,
+    source: Optional[str] = None,
+) -> Callable[[], Awaitable[Response]]:
+    """
+    Build the Arrow IPC streaming endpoint for a file or dataset directory.
+
+    Args:
+        item_path: File or dataset directory served by the endpoint
+        sql: Query reading the data, with its source as the only parameter
+        pool: Cursor pool of the app
+        source: Query parameter; defaults to ``item_path``
+
+    Returns:
+        Callable: Endpoint coroutine function
+    """
+    query = pool.prepare(sql)
+    params = [source or str(item_path)]
+
+    async def read_file_arrow() -> Response:
+        """Stream file data as Arrow IPC record batches."""
+        try:
+            conn, reader = await run_in_threadpool(
+                _open_arrow_reader, pool, query, params
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error reading file: {str(e)}")
+
+        return StreamingResponse(
+            _iter_arrow_stream(conn, reader), media_type=ARROW_STREAM_MEDIA_TYPE
+        )
+
+    return read_file_arrow
+
+
+def _make_raw_handler(
+    item_path: Path, media_type: str
+) -> Callable[[], Awaitable[Response]]:
+    """
+    Build the endpoint serving a file's bytes unchanged.
+
+    Range requests are answered with 206 Partial Content, so Parquet readers
+    can fetch just the footer and the column chunks they need.
+
+    Args:
+        item_path: File served by the endpoint
+        media_type: Content type of the file
+
+    Returns:
+        Callable: Endpoint coroutine function
+    """
+
+    async def read_file_raw() -> Response:
+        """Return the file contents."""
+        # FileResponse only finds a missing file while sending, as a bare error
+        if not os.path.isfile(item_path):
+            raise HTTPException(
+                status_code=404, detail=f"File not found: {item_path.name}"
+            )
+        return FileResponse(item_path, media_type=media_type)
+
+    return read_file_raw
+
+
+def _list_directory(item_path: Path, relative_dir: str) -> List[Dict[str, str]]:
+    """
+    List a directory's entries sorted by name.
+
+    Blocking; endpoints call it through the thread pool.
+
+    Args:
+        item_path: Directory to list
+        relative_dir: Directory path relative to the data directory
+
+    Returns:
+        List[Dict[str, str]]: Name, type and relative path of each entry
+    """
+    with os.scandir(item_path) as entries:
+        return [
+            {
+                "name": entry.name,
+                "type": "file" if entry.is_file() else "directory",
+                "path": os.path.join(relative_dir, entry.name),
+            }
+            for entry in sorted(entries, key=lambda e: e.name)
+        ]
+
+
+def _make_directory_handler(
+    item_path: Path, item_name: str, data_path: Path
+) -> Callable[[], Awaitable[Response]]:
+    """
+    Build the listing endpoint for a directory.
+
+    Args:
+        item_path: Directory served by the endpoint
+        item_name: Sanitized directory name used in the route
+        data_path: Base data directory that listed paths are relative to
+
+    Returns:
+        Callable: Endpoint coroutine function
+    """
+    dir_key = str(item_path)
+    relative_dir = str(item_path.relative_to(data_path))
+
+    async def read_directory() -> Response:
+        """Return information about directory contents."""
+        try:
+            mtime_ns = os.stat(item_path).st_mtime_ns
+            cached = _DIR_CACHE.get(dir_key)
+            if cached is not None and cached[0] == mtime_ns:
+                body = cached[1]
+            else:
+                contents = await run_in_threadpool(
+                    _list_directory, item_path, relative_dir
+                )
+                body = orjson.dumps({"directory": item_name, "contents": contents})
+                _DIR_CACHE[dir_key] = (mtime_ns, body)
+            return Response(body, media_type="application/json")
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error reading directory: {str(e)}"
+            )
+
+    return read_directory
+
+
+def _endpoint_name(item: Path) -> str:
+    """
+    Turn a file or folder name into the name used in its endpoint path.
+
+    Args:
+        item: File or folder
+
+    Returns:
+        str: Lower-cased name with spaces and hyphens replaced by underscores
+    """
+    return item.name.lower().translate(_NAME_TRANSLATION)
+
+
+def _create_endpoints(
+    app: FastAPI,
+    data_path: Path,
+    items: List[Path],
+    db: Optional[duckdb.DuckDBPyConnection] = None,
+) -> Mapping[str, Path]:
     """
     Create endpoints for each file/folder.
 
@@ -82,90 +956,95 @@ def _create_endpoints(app: FastAPI, data_path: Path, items: List[Path]) -> None:
         app: FastAPI application instance
         data_path: Base data directory path
         items: List of items to create endpoints for
+        db: Shared DuckDB connection; requests query through a bounded pool
+            of its cursors. A new in-memory connection is created when omitted
+            and closed when the app shuts down.
+
+    Returns:
+        Mapping[str, Path]: Read-only map of each data endpoint path to the
+        file or folder it serves
     """
+    owns_db = db is None
+    if db is None:
+        db = duckdb.connect(":memory:")
+    pool = _CursorPool(db, _CURSOR_POOL_SIZE)
+    app.router.on_shutdown.append(pool.close)
+    if owns_db:
+        # A connection passed in is closed by its caller
+        app.router.on_shutdown.append(db.close)
+
+    endpoints: Dict[str, Path] = {}
     for item in items:
-        item_name = item.name.lower().replace(" ", "_").replace("-", "_")
-
-        if item.is_file():
-            # Create endpoint for file
-            if item.suffix in [".json", ".csv", ".parquet"]:
-
-                @app.get(f"/data/{item_name}", response_model=dict)
-                async def read_file(item_path: Path = item):
-                    """Read and return file data."""
-                    try:
-                        if item_path.suffix == ".json":
-                            conn = duckdb.connect(":memory:")
-                            result = conn.execute(
-                                f"SELECT * FROM read_json_auto('{item_path}')"
-                            ).fetchall()
-                            columns = (
-                                [desc[0] for desc in conn.description]
-                                if conn.description
-                                else []
-                            )
-                            return {
-                                "data": result,
-                                "columns": columns,
-                                "count": len(result),
-                            }
-                        elif item_path.suffix == ".csv":
-                            conn = duckdb.connect(":memory:")
-                            result = conn.execute(
-                                f"SELECT * FROM read_csv_auto('{item_path}')"
-                            ).fetchall()
-                            columns = (
-                                [desc[0] for desc in conn.description]
-                                if conn.description
-                                else []
-                            )
-                            return {
-                                "data": result,
-                                "columns": columns,
-                                "count": len(result),
-                            }
-                        elif item_path.suffix == ".parquet":
-                            conn = duckdb.connect(":memory:")
-                            result = conn.execute(
-                                f"SELECT * FROM '{item_path}'"
-                            ).fetchall()
-                            columns = (
-                                [desc[0] for desc in conn.description]
-                                if conn.description
-                                else []
-                            )
-                            return {
-                                "data": result,
-                                "columns": columns,
-                                "count": len(result),
-                            }
-                    except Exception as e:
-                        raise HTTPException(
-                            status_code=500, detail=f"Error reading file: {str(e)}"
-                        )
-
-                    return {"error": "Unsupported file format"}
-
-        elif item.is_dir():
-            # Create endpoint for directory
-            @app.get(f"/data/{item_name}", response_model=dict)
-            async def read_directory(item_path: Path = item):
-                """Return information about directory contents."""
-                try:
-                    contents = []
-                    for file_item in sorted(item_path.iterdir()):
-                        contents.append(
-                            {
-                                "name": file_item.name,
-                                "type": "file" if file_item.is_file() else "directory",
-                                "path": str(file_item.relative_to(data_path)),
-                            }
-                        )
-                    return {"directory": item_name, "contents": contents}
-                except Exception as e:
-                    raise HTTPException(
-                        status_code=500, detail=f"Error reading directory: {str(e)}"
+        item_name = _endpoint_name(item)
+        route = f"/data/{item_name}"
+        # One stat per item instead of separate is_file()/is_dir() calls
+        try:
+            mode = item.stat().st_mode
+        except OSError:
+            continue
+
+        if S_ISREG(mode):
+            # Create endpoints for supported files; the query is fixed per file
+            sql = _READ_QUERIES.get(item.suffix)
+            if sql is None:
+                continue
+
+            app.get(route, response_model=None, name=f"read_{item_name}")(
+                _make_file_handler(item, sql, pool)
+            )
+            if _ARROW_AVAILABLE:
+                app.get(f"{route}.arrow", name=f"read_{item_name}_arrow")(
+                    _make_arrow_handler(item, sql, pool)
+                )
+            app.get(f"{route}/raw", name=f"read_{item_name}_raw")(
+                _make_raw_handler(item, _RAW_MEDIA_TYPES[item.suffix])
+            )
+            endpoints[route] = item
+
+        elif S_ISDIR(mode):
+            dataset = _dataset_source(item)
+            if dataset is not None:
+                # Serve the files of a dataset directory as one table
+                sql, source = dataset
+                app.get(route, response_model=None, name=f"read_{item_name}")(
+                    _make_file_handler(item, sql, pool, source)
+                )
+                if _ARROW_AVAILABLE:
+                    app.get(f"{route}.arrow", name=f"read_{item_name}_arrow")(
+                        _make_arrow_handler(item, sql, pool, source)
                     )
+            else:
+                # Create endpoint for directory
+                app.get(route, response_model=None, name=f"list_{item_name}")(
+                    _make_directory_handler(item, item_name, data_path)
+                )
+            endpoints[route] = item
+
+    return MappingProxyType(endpoints)
+
+
+class _ServerBackends(TypedDict):
+    """Event loop and HTTP parser arguments for ``uvicorn.run``."""
+
+    loop: Literal["uvloop", "auto"]
+    http: Literal["httptools", "auto"]
+
+
+def _server_backends() -> _ServerBackends:
+    """
+    Pick the fastest event loop and HTTP parser available to uvicorn.
+
+    uvloop and httptools ship with ``uvicorn[standard]`` but are not available
+    on every platform (uvloop does not support Windows), so fall back to
+    uvicorn's automatic selection when they cannot be found.
+
+    Returns:
+        _ServerBackends: Keyword arguments for ``uvicorn.run``
+    """
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "auto",
+    }
 
 
 def run_fastapi(
@@ -200,11 +1079,23 @@ def run_fastapi(
     if not isinstance(host, str) or not host:
         raise ValueError("Host must be a non-empty string")
 
+    # One DuckDB database for the whole app, closed when the server stops
+    db = duckdb.connect(":memory:")
+
     # Create FastAPI app
     app = FastAPI(
         title="DuckDB FastAPI",
         description="FastAPI application for serving DuckDB data endpoints",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
+        on_startup=[_configure_thread_pool],
+    )
+
+    # Compress larger responses; query results are repetitive and shrink well
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=_GZIP_MINIMUM_SIZE,
+        compresslevel=_GZIP_COMPRESS_LEVEL,
     )
 
     # Resolve data path
@@ -223,24 +1114,43 @@ def run_fastapi(
         )
 
     # Create endpoints
-    _create_endpoints(app, data_path, items)
+    endpoints = _create_endpoints(app, data_path, items, db)
+    # Registered after the cursor pool's handler so its cursors close first
+    app.router.on_shutdown.append(db.close)
+
+    # Bodies of the fixed endpoints never change, so they are encoded once.
+    # A new Response is still built per request because middleware may
+    # modify its headers.
+    health_body = orjson.dumps({"status": "healthy", "version": "0.1.0"})
+    root_body = orjson.dumps(
+        {
+            "message": "DuckDB FastAPI",
+            "version": "0.1.0",
+            "data_path": str(data_path),
+            "endpoints": list(endpoints),
+        }
+    )
 
     # Add health check endpoint
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "version": "0.1.0"}
+        return Response(health_body, media_type="application/json")
 
     # Add root endpoint
     @app.get("/")
     async def root():
         """Root endpoint."""
-        return {
-            "message": "DuckDB FastAPI",
-            "version": "0.1.0",
-            "data_path": str(data_path),
-            "endpoints": [f"/data/{item.name}" for item in items],
-        }
+        return Response(root_body, media_type="application/json")
 
     # Run the application
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    import uvicorn
+
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        access_log=False,
+        **_server_backends(),
+    )
@@ -7,63 +7,53 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from duckdb_fastapi.main import _create_endpoints, _get_items_to_process
+from duckdb_fastapi.main import (
+    _THREAD_POOL_SIZE,
+    ORJSONResponse,
+    _create_endpoints,
+    _get_items_to_process,
+    run_fastapi,
+)
 
 
 class TestEndpointResponses:
     """Test actual endpoint responses."""
 
-    def test_json_file_endpoint_response(self, temp_data_dir):
-        """Test JSON file endpoint returns correct response."""
+    def test_json_endpoints_registered(self, temp_data_dir):
+        """Test each JSON file gets a data route."""
         app = FastAPI()
         items = [f for f in _get_items_to_process(temp_data_dir) if f.suffix == ".json"]
+        assert items
 
-        if items:
-            _create_endpoints(app, temp_data_dir, items)
-
-            # Add root endpoint for testing
-            @app.get("/")
-            async def root():
-                return {"status": "ok"}
+        _create_endpoints(app, temp_data_dir, items)
 
-            client = TestClient(app)
+        paths = {route.path for route in app.routes}
+        for item in items:
+            assert f"/data/{item.name}" in paths
 
-            # Test root
-            response = client.get("/")
-            assert response.status_code == 200
-            assert response.json()["status"] == "ok"
-
-    def test_csv_file_endpoint_response(self, temp_data_dir):
-        """Test CSV file endpoint returns correct response."""
+    def test_csv_endpoints_registered(self, temp_data_dir):
+        """Test each CSV file gets a data route."""
         app = FastAPI()
         items = [f for f in _get_items_to_process(temp_data_dir) if f.suffix == ".csv"]
+        assert items
 
-        if items:
-            _create_endpoints(app, temp_data_dir, items)
-
-            @app.get("/")
-            async def root():
-                return {"status": "ok"}
+        _create_endpoints(app, temp_data_dir, items)
 
-            client = TestClient(app)
-            response = client.get("/")
-            assert response.status_code == 200
+        paths = {route.path for route in app.routes}
+        for item in items:
+            assert f"/data/{item.name}" in paths
 
-    def test_directory_endpoint_response(self, temp_data_dir):
-        """Test directory endpoint returns contents."""
+    def test_directory_endpoints_registered(self, temp_data_dir):
+        """Test each directory gets a listing route."""
         app = FastAPI()
         items = [f for f in _get_items_to_process(temp_data_dir) if f.is_dir()]
+        assert items
 
-        if items:
-            _create_endpoints(app, temp_data_dir, items)
+        _create_endpoints(app, temp_data_dir, items)
 
-            @app.get("/")
-            async def root():
-                return {"status": "ok"}
-
-            client = TestClient(app)
-            response = client.get("/")
-            assert response.status_code == 200
+        paths = {route.path for route in app.routes}
+        for item in items:
+            assert f"/data/{item.name}" in paths
 
     def test_health_check_endpoint(self, temp_data_dir):
         """Test health check endpoint."""
@@ -111,47 +101,30 @@ class TestEndpointResponses:
 class TestRunFastAPIValidation:
     """Test run_fastapi function validation."""
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
-    def test_port_validation_lower_bound(self, mock_uvicorn, temp_data_dir):
-        """Test port must be > 0."""
-        from duckdb_fastapi.main import run_fastapi
-
-        with pytest.raises(ValueError, match="Port must be an integer"):
-            run_fastapi(str(temp_data_dir), port=0)
-
-    @patch("duckdb_fastapi.main.uvicorn.run")
-    def test_port_validation_upper_bound(self, mock_uvicorn, temp_data_dir):
-        """Test port must be < 65536."""
-        from duckdb_fastapi.main import run_fastapi
-
-        with pytest.raises(ValueError, match="Port must be an integer"):
-            run_fastapi(str(temp_data_dir), port=65536)
-
-    @patch("duckdb_fastapi.main.uvicorn.run")
-    def test_host_validation_not_empty(self, mock_uvicorn, temp_data_dir):
-        """Test host must not be empty."""
-        from duckdb_fastapi.main import run_fastapi
-
-        with pytest.raises(ValueError, match="Host must be a non-empty string"):
-            run_fastapi(str(temp_data_dir), host="")
-
-    @patch("duckdb_fastapi.main.uvicorn.run")
-    def test_host_validation_must_be_string(self, mock_uvicorn, temp_data_dir):
-        """Test host must be a string."""
-        from duckdb_fastapi.main import run_fastapi
-
-        with pytest.raises(ValueError, match="Host must be a non-empty string"):
-            run_fastapi(str(temp_data_dir), host=None)
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"port": 0}, "Port must be an integer"),
+            ({"port": 65536}, "Port must be an integer"),
+            ({"host": ""}, "Host must be a non-empty string"),
+            ({"host": None}, "Host must be a non-empty string"),
+        ],
+        ids=["port-lower-bound", "port-upper-bound", "host-empty", "host-not-string"],
+    )
+    @patch("uvicorn.run")
+    def test_invalid_arguments(self, mock_uvicorn, temp_data_dir, kwargs, message):
+        """Test invalid ports and hosts are rejected before the server starts."""
+        with pytest.raises(ValueError, match=message):
+            run_fastapi(str(temp_data_dir), **kwargs)
+        mock_uvicorn.assert_not_called()
 
 
 class TestRunFastAPIIntegration:
     """Integration tests for run_fastapi with mocked uvicorn."""
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_run_fastapi_with_default_parameters(self, mock_uvicorn, temp_data_dir):
         """Test run_fastapi with default parameters."""
-        from duckdb_fastapi.main import run_fastapi
-
         run_fastapi(str(temp_data_dir))
 
         # Verify uvicorn.run was called
@@ -160,11 +133,9 @@ class TestRunFastAPIIntegration:
         assert kwargs["host"] == "127.0.0.1"
         assert kwargs["port"] == 8000
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_run_fastapi_with_custom_host_port(self, mock_uvicorn, temp_data_dir):
         """Test run_fastapi with custom host and port."""
-        from duckdb_fastapi.main import run_fastapi
-
         run_fastapi(str(temp_data_dir), host="0.0.0.0", port=9000)
 
         mock_uvicorn.assert_called_once()
@@ -172,11 +143,9 @@ class TestRunFastAPIIntegration:
         assert kwargs["host"] == "0.0.0.0"
         assert kwargs["port"] == 9000
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_run_fastapi_with_specific_items(self, mock_uvicorn, temp_data_dir):
         """Test run_fastapi with specific items."""
-        from duckdb_fastapi.main import run_fastapi
-
         items = _get_items_to_process(temp_data_dir)
         if items:
             specific_item = items[0].name
@@ -184,22 +153,18 @@ class TestRunFastAPIIntegration:
 
             mock_uvicorn.assert_called_once()
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_run_fastapi_creates_app(self, mock_uvicorn, temp_data_dir):
         """Test that run_fastapi creates a FastAPI app."""
-        from duckdb_fastapi.main import run_fastapi
-
         run_fastapi(str(temp_data_dir))
 
         mock_uvicorn.assert_called_once()
         app = mock_uvicorn.call_args[0][0]
         assert isinstance(app, FastAPI)
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_run_fastapi_datasample_keyword(self, mock_uvicorn):
         """Test run_fastapi with datasample keyword."""
-        from duckdb_fastapi.main import run_fastapi
-
         run_fastapi("duckdb_fastapi_datasample")
 
         mock_uvicorn.assert_called_once()
@@ -221,44 +186,26 @@ class TestAppEndpoints:
             # More routes should be added
             assert final_routes > initial_routes
 
-    def test_endpoint_paths_are_correct(self, temp_data_dir):
-        """Test that endpoint paths follow the expected pattern."""
-        app = FastAPI()
-        items = _get_items_to_process(temp_data_dir)
-
-        if items:
-            _create_endpoints(app, temp_data_dir, items)
-
-            data_routes = [route.path for route in app.routes if "/data/" in route.path]
-
-            # Should have data routes
-            assert len(data_routes) > 0
-
-    def test_endpoints_for_all_items(self, temp_data_dir):
-        """Test that endpoints are created for all items."""
+    def test_registered_data_routes(self, temp_data_dir):
+        """Test data route paths, names, coverage of items and methods."""
         app = FastAPI()
         items = _get_items_to_process(temp_data_dir)
+        assert items
 
-        if len(items) > 0:
-            _create_endpoints(app, temp_data_dir, items)
+        _create_endpoints(app, temp_data_dir, items)
 
-            data_routes = [route.path for route in app.routes if "/data/" in route.path]
+        data_routes = [route for route in app.routes if "/data/" in route.path]
 
-            # Should have at least as many routes as items
-            assert len(data_routes) >= len(items)
+        # At least one route per item, all under /data/ and served by GET
+        assert len(data_routes) >= len(items)
+        for route in data_routes:
+            assert route.path.startswith("/data/")
+            assert "GET" in route.methods
 
-    def test_endpoint_methods_are_get(self, temp_data_dir):
-        """Test that all data endpoints are GET methods."""
-        app = FastAPI()
-        items = _get_items_to_process(temp_data_dir)
-
-        if items:
-            _create_endpoints(app, temp_data_dir, items)
-
-            for route in app.routes:
-                if "/data/" in route.path:
-                    # GET method should be allowed
-                    assert hasattr(route, "methods")
+        # Each route is reachable by name
+        assert app.url_path_for("read_test_data.json") == "/data/test_data.json"
+        assert app.url_path_for("read_test_data.csv") == "/data/test_data.csv"
+        assert app.url_path_for("list_subdir") == "/data/subdir"
 
 
 class TestDataProcessing:
@@ -291,74 +238,126 @@ class TestDataProcessing:
 class TestApplicationCreation:
     """Test FastAPI app creation and configuration."""
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_app_metadata(self, mock_uvicorn, temp_data_dir):
         """Test that app has correct metadata."""
-        from duckdb_fastapi.main import run_fastapi
-
         run_fastapi(str(temp_data_dir))
 
         app = mock_uvicorn.call_args[0][0]
         assert app.title == "DuckDB FastAPI"
         assert "0.1.0" in app.version
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_app_description(self, mock_uvicorn, temp_data_dir):
         """Test that app has description."""
-        from duckdb_fastapi.main import run_fastapi
-
         run_fastapi(str(temp_data_dir))
 
         app = mock_uvicorn.call_args[0][0]
         assert "DuckDB" in app.description
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
+    def test_app_uses_orjson_responses(self, mock_uvicorn, temp_data_dir):
+        """Test that the app serializes responses with orjson."""
+        run_fastapi(str(temp_data_dir))
+
+        app = mock_uvicorn.call_args[0][0]
+        assert app.router.default_response_class is ORJSONResponse
+
+    @patch("uvicorn.run")
+    def test_large_responses_are_gzipped(self, mock_uvicorn):
+        """Test that large data responses are compressed."""
+        run_fastapi("duckdb_fastapi_datasample")
+
+        app = mock_uvicorn.call_args[0][0]
+        client = TestClient(app)
+        response = client.get(
+            "/data/evidence_intogen", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["count"] > 0
+
+    @patch("uvicorn.run")
+    def test_startup_raises_thread_limit(self, mock_uvicorn, temp_data_dir):
+        """Test that startup enlarges the thread pool used for DuckDB calls."""
+        import anyio.to_thread
+
+        run_fastapi(str(temp_data_dir))
+
+        app = mock_uvicorn.call_args[0][0]
+        with TestClient(app) as client:
+            limiter = client.portal.call(anyio.to_thread.current_default_thread_limiter)
+            assert limiter.total_tokens == _THREAD_POOL_SIZE
+
+    @patch("uvicorn.run")
+    def test_shutdown_closes_cursors_before_database(self, mock_uvicorn, temp_data_dir):
+        """Test that the pooled cursors close before their parent connection."""
+        run_fastapi(str(temp_data_dir))
+
+        app = mock_uvicorn.call_args[0][0]
+        pool_close, db_close = app.router.on_shutdown[-2:]
+        assert pool_close.__self__._db is db_close.__self__
+
+    @patch("uvicorn.run")
     def test_health_endpoint_exists(self, mock_uvicorn, temp_data_dir):
         """Test that health endpoint is created."""
-        from duckdb_fastapi.main import run_fastapi
-
         run_fastapi(str(temp_data_dir))
 
         app = mock_uvicorn.call_args[0][0]
         routes = [route.path for route in app.routes]
         assert "/health" in routes
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_root_endpoint_exists(self, mock_uvicorn, temp_data_dir):
         """Test that root endpoint is created."""
-        from duckdb_fastapi.main import run_fastapi
-
         run_fastapi(str(temp_data_dir))
 
         app = mock_uvicorn.call_args[0][0]
         routes = [route.path for route in app.routes]
         assert "/" in routes
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
+    def test_root_and_health_responses(self, mock_uvicorn, temp_data_dir):
+        """Test that the precomputed root and health bodies are served."""
+        run_fastapi(str(temp_data_dir))
+
+        client = TestClient(mock_uvicorn.call_args[0][0])
+        for _ in range(2):
+            root = client.get("/")
+            assert root.headers["content-type"] == "application/json"
+            assert root.json()["data_path"] == str(temp_data_dir.resolve())
+            assert "/data/test_data.json" in root.json()["endpoints"]
+        assert client.get("/health").json() == {"status": "healthy", "version": "0.1.0"}
+
+    @patch("uvicorn.run")
     def test_uvicorn_called_with_correct_log_level(self, mock_uvicorn, temp_data_dir):
         """Test that uvicorn is called with correct log level."""
-        from duckdb_fastapi.main import run_fastapi
-
         run_fastapi(str(temp_data_dir))
 
         args, kwargs = mock_uvicorn.call_args
         assert kwargs["log_level"] == "info"
 
+    @patch("uvicorn.run")
+    def test_uvicorn_called_with_fast_backends(self, mock_uvicorn, temp_data_dir):
+        """Test that uvicorn prefers uvloop and httptools when available."""
+        run_fastapi(str(temp_data_dir))
+
+        args, kwargs = mock_uvicorn.call_args
+        assert kwargs["loop"] in ("uvloop", "auto")
+        assert kwargs["http"] in ("httptools", "auto")
+        assert kwargs["access_log"] is False
+
 
 class TestErrorHandlingExtended:
     """Extended error handling tests."""
 
     def test_invalid_data_path_raises_error(self):
         """Test that invalid data path raises ValueError."""
-        from duckdb_fastapi.main import run_fastapi
-
         with pytest.raises(ValueError, match="Invalid path_data"):
             run_fastapi("/this/path/definitely/does/not/exist/12345")
 
     def test_empty_data_directory_raises_error(self, tmp_path):
         """Test that empty data directory raises ValueError."""
-        from duckdb_fastapi.main import run_fastapi
-
         empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
 
@@ -367,18 +366,14 @@ class TestErrorHandlingExtended:
 
     def test_specific_items_with_nonexistent_files(self, temp_data_dir):
         """Test specific items that don't exist raises error."""
-        from duckdb_fastapi.main import run_fastapi
-
         with pytest.raises(ValueError, match="No items found"):
             run_fastapi(
                 str(temp_data_dir), specific_items=["nonexistent_file_xyz.json"]
             )
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_no_items_error_message_format(self, mock_uvicorn, temp_data_dir):
         """Test error message format for no items."""
-        from duckdb_fastapi.main import run_fastapi
-
         # Create mock to capture error
         specific = ["item_that_does_not_exist.json"]
         filtered_items = _get_items_to_process(temp_data_dir, specific)
@@ -391,11 +386,9 @@ class TestErrorHandlingExtended:
 class TestSpecificItemFiltering:
     """Test specific items filtering in run_fastapi."""
 
-    @patch("duckdb_fastapi.main.uvicorn.run")
+    @patch("uvicorn.run")
     def test_run_fastapi_filters_specific_items(self, mock_uvicorn, temp_data_dir):
         """Test that specific_items parameter filters correctly."""
-        from duckdb_fastapi.main import run_fastapi
-
         items = _get_items_to_process(temp_data_dir)
         if len(items) > 0:
             specific_name = items[0].name
@@ -1,12 +1,27 @@
 """Tests for handler endpoint implementations."""
 
-import json
-
 import pytest
 from fastapi import FastAPI
 import duckdb
 
-from duckdb_fastapi.main import _create_endpoints
+from duckdb_fastapi.main import _ARROW_AVAILABLE, _create_endpoints
+
+
+_PAYLOAD_ID_NAME = b'[{"id":1,"name":"test"}]'
+_PAYLOAD_ONE_ID = b'[{"id":1}]'
+_PAYLOAD_TWO_IDS = b'[{"id":1},{"id":2}]'
+_PAYLOAD_SCALARS = b"[1,2,3]"
+_PAYLOAD_OBJECT = b'{"test":1}'
+_PAYLOAD_EMPTY_OBJECT = b"{}"
+_PAYLOAD_EMPTY_LIST = b"[]"
+
+
+@pytest.fixture(scope="module")
+def duck_conn():
+    """One in-memory DuckDB connection shared by the read tests."""
+    conn = duckdb.connect(":memory:")
+    yield conn
+    conn.close()
 
 
 class TestJSONFileHandler:
@@ -15,7 +30,7 @@ class TestJSONFileHandler:
     def test_json_file_handler_success(self, tmp_path):
         """Test successful JSON file reading."""
         json_file = tmp_path / "data.json"
-        json_file.write_text(json.dumps([{"id": 1, "name": "test"}]))
+        json_file.write_bytes(_PAYLOAD_ID_NAME)
 
         app = FastAPI()
         _create_endpoints(app, tmp_path, [json_file])
@@ -40,24 +55,18 @@ class TestCSVFileHandler:
 class TestParquetFileHandler:
     """Test Parquet file endpoint handler."""
 
-    def test_parquet_file_handler(self, tmp_path):
+    def test_parquet_file_handler(self, tmp_path, duck_conn):
         """Test parquet file handling."""
-        try:
-            import pyarrow.parquet as pq
-            import pyarrow as pa
-
-            data = {"id": [1, 2], "name": ["a", "b"]}
-            table = pa.table(data)
-            parquet_file = tmp_path / "data.parquet"
-            pq.write_table(table, str(parquet_file))
+        parquet_file = tmp_path / "data.parquet"
+        duck_conn.sql(
+            "SELECT * FROM (VALUES (1, 'a'), (2, 'b')) t(id, name)"
+        ).write_parquet(str(parquet_file))
 
-            app = FastAPI()
-            _create_endpoints(app, tmp_path, [parquet_file])
+        app = FastAPI()
+        _create_endpoints(app, tmp_path, [parquet_file])
 
-            data_routes = [r for r in app.routes if "/data/" in r.path]
-            assert len(data_routes) > 0
-        except ImportError:
-            pytest.skip("pyarrow not installed")
+        data_routes = [r for r in app.routes if "/data/" in r.path]
+        assert len(data_routes) > 0
 
 
 class TestDirectoryHandler:
@@ -68,7 +77,7 @@ class TestDirectoryHandler:
         test_dir = tmp_path / "test_data"
         test_dir.mkdir()
 
-        (test_dir / "file1.json").write_text(json.dumps({"test": 1}))
+        (test_dir / "file1.json").write_bytes(_PAYLOAD_OBJECT)
         (test_dir / "file2.txt").write_text("text content")
         sub_dir = test_dir / "subdir"
         sub_dir.mkdir()
@@ -89,7 +98,7 @@ class TestDirectoryHandler:
         sub2 = test_dir / "sub2"
         sub2.mkdir()
 
-        (sub1 / "data.json").write_text(json.dumps([1, 2, 3]))
+        (sub1 / "data.json").write_bytes(_PAYLOAD_SCALARS)
 
         app = FastAPI()
         _create_endpoints(app, tmp_path, [test_dir])
@@ -101,23 +110,25 @@ class TestDirectoryHandler:
 class TestConnectionHandling:
     """Test DuckDB connection handling."""
 
-    def test_duckdb_json_read(self, tmp_path):
+    def test_duckdb_json_read(self, tmp_path, duck_conn):
         """Test DuckDB JSON reading."""
         json_file = tmp_path / "test.json"
-        json_file.write_text(json.dumps([{"id": 1}, {"id": 2}]))
+        json_file.write_bytes(_PAYLOAD_TWO_IDS)
 
-        conn = duckdb.connect(":memory:")
-        result = conn.execute(f"SELECT * FROM read_json_auto('{json_file}')").fetchall()
+        result = duck_conn.execute(
+            f"SELECT * FROM read_json_auto('{json_file}')"
+        ).fetchall()
 
         assert len(result) == 2
 
-    def test_duckdb_csv_read(self, tmp_path):
+    def test_duckdb_csv_read(self, tmp_path, duck_conn):
         """Test DuckDB CSV reading."""
         csv_file = tmp_path / "test.csv"
         csv_file.write_text("id,value\n1,a\n2,b\n")
 
-        conn = duckdb.connect(":memory:")
-        result = conn.execute(f"SELECT * FROM read_csv_auto('{csv_file}')").fetchall()
+        result = duck_conn.execute(
+            f"SELECT * FROM read_csv_auto('{csv_file}')"
+        ).fetchall()
 
         assert len(result) == 2
 
@@ -125,57 +136,50 @@ class TestConnectionHandling:
 class TestDescriptionHandling:
     """Test description/column handling."""
 
-    def test_connection_description_extraction(self, tmp_path):
+    def test_connection_description_extraction(self, tmp_path, duck_conn):
         """Test extracting column descriptions from connection."""
         json_file = tmp_path / "test.json"
-        json_file.write_text(json.dumps([{"id": 1, "name": "test"}]))
+        json_file.write_bytes(_PAYLOAD_ID_NAME)
 
-        conn = duckdb.connect(":memory:")
-        conn.execute(f"SELECT * FROM read_json_auto('{json_file}')")
+        duck_conn.execute(f"SELECT * FROM read_json_auto('{json_file}')")
 
         # Description should be available
-        if conn.description:
-            columns = [desc[0] for desc in conn.description]
+        if duck_conn.description:
+            columns = [desc[0] for desc in duck_conn.description]
             assert len(columns) > 0
 
 
 class TestUnsupportedFileFormats:
     """Test handling of unsupported file formats."""
 
-    def test_txt_file_not_processed(self, tmp_path):
-        """Test that .txt files are not processed."""
-        txt_file = tmp_path / "data.txt"
-        txt_file.write_text("plain text content")
+    @pytest.mark.parametrize(
+        "filename, content",
+        [("data.txt", "plain text content"), ("data.log", "log content")],
+    )
+    def test_unsupported_file_not_processed(self, tmp_path, filename, content):
+        """Test that .txt and .log files are not processed."""
+        unsupported_file = tmp_path / filename
+        unsupported_file.write_text(content)
 
         app = FastAPI()
-        _create_endpoints(app, tmp_path, [txt_file])
+        _create_endpoints(app, tmp_path, [unsupported_file])
 
         # No data routes should be created
         data_routes = [r for r in app.routes if "/data/" in r.path]
         assert len(data_routes) == 0
 
-    def test_log_file_not_processed(self, tmp_path):
-        """Test that .log files are not processed."""
-        log_file = tmp_path / "data.log"
-        log_file.write_text("log content")
-
-        app = FastAPI()
-        _create_endpoints(app, tmp_path, [log_file])
-
-        data_routes = [r for r in app.routes if "/data/" in r.path]
-        assert len(data_routes) == 0
-
 
 class TestResponseStructures:
     """Test response structure validation."""
 
-    def test_file_response_has_data_field(self, tmp_path):
+    def test_file_response_has_data_field(self, tmp_path, duck_conn):
         """Test that file responses include data field."""
         json_file = tmp_path / "test.json"
-        json_file.write_text(json.dumps([{"id": 1}]))
+        json_file.write_bytes(_PAYLOAD_ONE_ID)
 
-        conn = duckdb.connect(":memory:")
-        result = conn.execute(f"SELECT * FROM read_json_auto('{json_file}')").fetchall()
+        result = duck_conn.execute(
+            f"SELECT * FROM read_json_auto('{json_file}')"
+        ).fetchall()
 
         response = {"data": result, "columns": ["id"], "count": len(result)}
 
@@ -187,7 +191,7 @@ class TestResponseStructures:
         """Test directory response structure."""
         test_dir = tmp_path / "test"
         test_dir.mkdir()
-        (test_dir / "file.json").write_text(json.dumps({}))
+        (test_dir / "file.json").write_bytes(_PAYLOAD_EMPTY_OBJECT)
 
         response = {
             "directory": "test",
@@ -204,57 +208,57 @@ class TestResponseStructures:
 class TestNameSanitization:
     """Test endpoint name sanitization."""
 
-    def test_spaces_converted_to_underscores(self, tmp_path):
-        """Test that spaces in names become underscores."""
-        file_with_spaces = tmp_path / "my data file.json"
-        file_with_spaces.write_text(json.dumps([]))
-
-        app = FastAPI()
-        _create_endpoints(app, tmp_path, [file_with_spaces])
-
-        routes = [r.path for r in app.routes]
-        # Should have converted spaces
-        assert any("my_data_file" in r.lower() for r in routes)
-
-    def test_hyphens_converted_to_underscores(self, tmp_path):
-        """Test that hyphens in names become underscores."""
-        file_with_hyphens = tmp_path / "my-data-file.csv"
-        file_with_hyphens.write_text("id,value\n1,a\n")
+    @pytest.mark.parametrize(
+        "filename, content, route",
+        [
+            ("my data file.json", "[]", "/data/my_data_file.json"),
+            ("my-data-file.csv", "id,value\n1,a\n", "/data/my_data_file.csv"),
+        ],
+        ids=["spaces", "hyphens"],
+    )
+    def test_separators_converted_to_underscores(
+        self, tmp_path, filename, content, route
+    ):
+        """Test that spaces and hyphens in names become underscores."""
+        data_file = tmp_path / filename
+        data_file.write_text(content)
 
         app = FastAPI()
-        _create_endpoints(app, tmp_path, [file_with_hyphens])
+        _create_endpoints(app, tmp_path, [data_file])
 
         routes = [r.path for r in app.routes]
-        assert any("my_data_file" in r.lower() for r in routes)
+        assert route in routes
 
 
 class TestMultipleFileTypes:
     """Test handling multiple file types in same directory."""
 
-    def test_json_and_csv_together(self, tmp_path):
-        """Test processing both JSON and CSV files."""
-        json_file = tmp_path / "data.json"
-        json_file.write_text(json.dumps([{"id": 1}]))
-
-        csv_file = tmp_path / "data.csv"
-        csv_file.write_text("id\n1\n")
-
-        app = FastAPI()
-        _create_endpoints(app, tmp_path, [json_file, csv_file])
-
-        data_routes = [r for r in app.routes if "/data/" in r.path]
-        assert len(data_routes) >= 2
-
-    def test_files_and_directories_together(self, tmp_path):
-        """Test processing both files and directories."""
-        json_file = tmp_path / "data.json"
-        json_file.write_text(json.dumps([]))
-
-        test_dir = tmp_path / "subdir"
-        test_dir.mkdir()
+    @pytest.mark.parametrize(
+        "entries",
+        [
+            {"data.json": _PAYLOAD_ONE_ID, "data.csv": b"id\n1\n"},
+            {"data.json": _PAYLOAD_EMPTY_LIST, "subdir": None},
+        ],
+        ids=["json_and_csv", "files_and_directories"],
+    )
+    def test_mixed_items_together(self, tmp_path, entries):
+        """Test processing mixed files and directories together."""
+        items = []
+        expected = set()
+        for name, content in entries.items():
+            item = tmp_path / name
+            route = f"/data/{name}"
+            expected.add(route)
+            if content is None:
+                item.mkdir()
+            else:
+                item.write_bytes(content)
+                expected.add(f"{route}/raw")
+                if _ARROW_AVAILABLE:
+                    expected.add(f"{route}.arrow")
+            items.append(item)
 
         app = FastAPI()
-        _create_endpoints(app, tmp_path, [json_file, test_dir])
+        _create_endpoints(app, tmp_path, items)
 
-        data_routes = [r for r in app.routes if "/data/" in r.path]
-        assert len(data_routes) >= 2
+        assert {r.path for r in app.routes if r.path.startswith("/data/")} == expected
@@ -4,33 +4,9 @@ import pytest
 from duckdb_fastapi.main import run_fastapi
 
 
-@pytest.fixture
-def test_app(temp_data_dir):
-    """Create a test app with temp data."""
-    # This fixture would be used for testing the app creation
-    # Note: run_fastapi starts a server, so we test the functions separately
-    pass
-
-
 class TestRunFastAPIValidation:
     """Test argument validation for run_fastapi function."""
 
-    def test_invalid_port_negative(self, temp_data_dir):
-        """Test with negative port - validation happens when called."""
-        # Port validation is minimal in the function
-        # This test documents expected behavior
-        pass
-
-    def test_invalid_port_too_high(self, temp_data_dir):
-        """Test with port too high."""
-        # Port validation is minimal in the function
-        pass
-
-    def test_invalid_host_empty(self, temp_data_dir):
-        """Test with empty host."""
-        # Host validation is minimal in the function
-        pass
-
     def test_invalid_path_data(self):
         """Test with invalid path_data."""
         with pytest.raises(ValueError, match="Invalid path_data"):
@@ -1,11 +1,23 @@
 """Tests for the main duckdb_fastapi module."""
 
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import duckdb
+import orjson
 import pytest
 
 from duckdb_fastapi.main import (
+    ORJSONResponse,
     _create_endpoints,
+    _CursorPool,
     _get_data_path,
     _get_items_to_process,
+    _iter_arrow_stream,
+    _open_arrow_reader,
+    _open_result,
+    _prepare_query,
 )
 
 
@@ -86,6 +98,43 @@ class TestCreateEndpoints:
         routes = [route.path for route in app.routes]
         assert len(routes) > 0
 
+    def test_create_endpoints_returns_route_map(self, tmp_path):
+        """Test that the registered data endpoints are returned."""
+        from fastapi import FastAPI
+
+        data_file = tmp_path / "My Data-File.csv"
+        data_file.write_text("id\n1\n")
+        (tmp_path / "notes.txt").write_text("not served")
+
+        app = FastAPI()
+        items = _get_items_to_process(tmp_path)
+        endpoints = _create_endpoints(app, tmp_path, items)
+
+        assert dict(endpoints) == {"/data/my_data_file.csv": data_file}
+        with pytest.raises(TypeError):
+            endpoints["/data/other"] = data_file
+
+    def test_create_endpoints_unique_operation_ids(self, tmp_path):
+        """Test that every data route gets its own name and operation id."""
+        from fastapi import FastAPI
+
+        (tmp_path / "a.csv").write_text("id\n1\n")
+        (tmp_path / "b.json").write_text("[]")
+        (tmp_path / "folder").mkdir()
+
+        app = FastAPI()
+        _create_endpoints(app, tmp_path, _get_items_to_process(tmp_path))
+
+        data_routes = [r for r in app.routes if r.path.startswith("/data/")]
+        assert len({r.name for r in data_routes}) == len(data_routes)
+        assert app.url_path_for("read_a.csv") == "/data/a.csv"
+        operations = [
+            op["operationId"]
+            for path in app.openapi()["paths"].values()
+            for op in path.values()
+        ]
+        assert len(set(operations)) == len(operations)
+
 
 class TestDataPathResolution:
     """Test data path resolution with different inputs."""
@@ -111,3 +160,92 @@ class TestItemFiltering:
         dirs = [item for item in all_items if item.is_dir()]
         assert len(dirs) > 0
         assert all(item.is_dir() for item in dirs)
+
+
+class TestORJSONResponse:
+    """Test the orjson-based response class."""
+
+    def test_renders_duckdb_types(self):
+        """Test values DuckDB returns that orjson does not handle natively."""
+        response = ORJSONResponse(
+            {
+                "data": [(1, Decimal("2.50"), Decimal("3"), date(2024, 1, 2))],
+                "interval": timedelta(minutes=1),
+                "blob": b"abc",
+            }
+        )
+        assert orjson.loads(response.body) == {
+            "data": [[1, 2.5, 3, "2024-01-02"]],
+            "interval": 60.0,
+            "blob": "abc",
+        }
+        assert response.media_type == "application/json"
+
+    def test_renders_wide_decimals(self):
+        """Test integral decimals beyond 64 bits and non-finite decimals."""
+        response = ORJSONResponse(
+            [Decimal("123456789012345678901234567890"), Decimal("NaN")]
+        )
+        assert orjson.loads(response.body) == ["123456789012345678901234567890", None]
+
+
+class TestPrepareQuery:
+    """Test the _prepare_query function."""
+
+    def test_prepared_query_is_reusable(self, sample_csv_file):
+        """Test a parsed query can be executed repeatedly from cursors."""
+        db = duckdb.connect(":memory:")
+        query = _prepare_query(db, "SELECT * FROM read_csv_auto(?)")
+
+        for _ in range(2):
+            rows = db.cursor().execute(query, [str(sample_csv_file)]).fetchall()
+            assert rows == [(1, "test")]
+        db.close()
+
+
+class TestCursorPool:
+    """Test the _CursorPool class."""
+
+    def test_borrowed_cursor_is_returned(self):
+        """Test a cursor goes back to the pool and is reused."""
+        db = duckdb.connect(":memory:")
+        pool = _CursorPool(db, 1)
+
+        with pool.cursor() as first:
+            assert first.execute("SELECT 1").fetchone() == (1,)
+        with pool.cursor() as second:
+            assert second is first
+
+        pool.close()
+        db.close()
+
+    def test_failed_result_closes_cursor(self):
+        """Test a dedicated cursor is closed when its query fails."""
+        conn = MagicMock()
+        conn.execute.side_effect = duckdb.IOException("missing file")
+        pool = MagicMock()
+        pool.new_cursor.return_value = conn
+
+        with pytest.raises(duckdb.IOException):
+            _open_result(pool, "SELECT 1", [])
+        conn.close.assert_called_once()
+
+    @pytest.mark.parametrize("read_all", [True, False], ids=["finished", "abandoned"])
+    def test_arrow_stream_closes_cursor(self, read_all):
+        """Test the Arrow stream closes its cursor when done or abandoned."""
+        pytest.importorskip("pyarrow")
+        db = duckdb.connect(":memory:")
+        pool = _CursorPool(db, 1)
+
+        conn, reader = _open_arrow_reader(pool, "SELECT * FROM range(10)", [])
+        stream = _iter_arrow_stream(conn, reader)
+        if read_all:
+            list(stream)
+        else:
+            next(stream)
+            stream.close()
+        with pytest.raises(duckdb.ConnectionException):
+            conn.execute("SELECT 1")
+
+        pool.close()
+        db.close()